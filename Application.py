@@ -4,6 +4,7 @@ import os
 import sys
 import traceback
 import logging
+import pickle
 import pandas as pd
 import streamlit as st
 from src.utils import (
@@ -23,7 +24,11 @@ from src.utils import (
     save_dataframe,
     initialize_session_state,
     update_session_state,
-    help_info  
+    get_help,
+    PLOT_DPI,
+    plot_fitness_history,
+    plot_time_taken,
+    plot_comparative_distributions
 )
 from src.config import (
     PROCESSED_DATA_DIR,
@@ -49,14 +54,7 @@ from src.data_processing import DataProcessor
 
 # Import necessary modules for this section
 from src.binning_optimizer import BinningOptimizer
-from src.utils import (
-    save_dataframe,
-    plot_fitness_history,
-    plot_time_taken,
-    plot_comparative_distributions
-)
 import matplotlib.pyplot as plt
-from src.utils.utils_plotting import plot_distributions, compare_correlations
 
 # =====================================
 # Logging Configuration
@@ -116,13 +114,18 @@ def sidebar_inputs():
     """Render the sidebar with file upload, settings, binning options, and info."""
     with st.sidebar:
         st.header("📂 Upload & Settings")
-        uploaded_file = st.file_uploader("📤 Upload your dataset", type=['csv', 'pkl'], help=help_info['sidebar_inputs']['uploaded_file'])
+        uploaded_file = st.file_uploader("📤 Upload your dataset", type=['csv', 'pkl'], help=get_help()['sidebar_inputs']['uploaded_file'])
         
         output_file_type = st.selectbox(
             '📁 Select Output File Type', 
             ['csv', 'pkl'], 
             index=0, 
-            help=help_info['sidebar_inputs']['output_file_type']
+            help=get_help()['sidebar_inputs']['output_file_type']
+        )
+        st.session_state.use_arrow = st.checkbox(
+            "⚡ Fast CSV Loading (PyArrow)",
+            value=st.session_state.get('use_arrow', False),
+            help=get_help()['sidebar_inputs']['use_arrow']
         )
         st.markdown("---")
 
@@ -130,13 +133,13 @@ def sidebar_inputs():
         binning_method = st.selectbox(
             '🔧 Select Binning Method', 
             ['Quantile', 'Equal Width'],
-            help=help_info['sidebar_inputs']['binning_method']
+            help=get_help()['sidebar_inputs']['binning_method']
         )
         if binning_method == 'Equal Width':
             st.warning("⚠️ **Note:** Using Equal Width will drastically affect the distribution of your data. (Large integrity loss)")
 
         st.header("ℹ️ About")
-        st.info(help_info['about_application'])
+        st.info(get_help()['about_application'])
 
         st.markdown("---")
 
@@ -233,7 +236,7 @@ def load_and_preview_data(uploaded_file, input_file_type):
     """Load the uploaded data and display a preview."""
     try:
         with st.spinner('Loading data...'):
-            Data, error = load_data(input_file_type, uploaded_file)
+            Data, error = load_data(input_file_type, uploaded_file, use_arrow=st.session_state.use_arrow)
         if error:
             logger.error(f"Data loading error: {error}")
             st.error(error)
@@ -257,7 +260,7 @@ def save_raw_data(Data, output_file_type):
     data_path = os.path.join(DATA_DIR, f'Data.{output_file_type}')
     try:
         if mapped_save_type == 'pickle':
-            Data.to_pickle(data_path)
+            Data.to_pickle(data_path, protocol=pickle.HIGHEST_PROTOCOL)
             logger.info(f"Data saved as Pickle at {data_path}.")
         else:
             Data.to_csv(data_path, index=False)
@@ -294,7 +297,7 @@ def binning_tab():
         'Select columns to bin',
         options=available_columns,
         key='binning_columns_form',
-        help=help_info['binning_tab']['selected_columns_binning']
+        help=get_help()['binning_tab']['selected_columns_binning']
     )
     
     # Update session state without causing interference
@@ -308,7 +311,7 @@ def binning_tab():
         bins = get_binning_configuration(original_data, selected_columns_binning)
         logger.info("Binning configuration retrieved.")
     else:
-        st.info(help_info['binning_tab']['select_columns_binning'])
+        st.info(get_help()['binning_tab']['select_columns_binning'])
         logger.warning("No columns selected for binning.")
     
     # Button to process binning
@@ -316,7 +319,7 @@ def binning_tab():
     switch_state = st.checkbox(
         'Start Dynamic Binning', 
         key='binning_switch', 
-        help=help_info['binning_tab']['start_dynamic_binning']
+        help=get_help()['binning_tab']['start_dynamic_binning']
     )
 
     if bins and selected_columns_binning and switch_state:
@@ -365,13 +368,13 @@ def binning_tab():
                         logger.info(f"Entropy plot saved at {entropy_plot_path}.")
                         
                         # Display entropy plot
-                        st.pyplot(entropy_fig)
+                        st.pyplot(entropy_fig, dpi=PLOT_DPI)
                         logger.debug("Entropy plot displayed.")
             st.write("---")
             # Add association rule mining parameters
             with st.expander("🔍 Association Rule Mining Settings"):
-                min_support = st.slider("Minimum Support", 0.01, 1.0, 0.05, 0.01, help=help_info['binning_tab']['min_support'])
-                min_threshold = st.slider("Minimum Confidence Threshold", 0.01, 1.0, 0.05, 0.01, help=help_info['binning_tab']['min_threshold'])
+                min_support = st.slider("Minimum Support", 0.01, 1.0, 0.05, 0.01, help=get_help()['binning_tab']['min_support'])
+                min_threshold = st.slider("Minimum Confidence Threshold", 0.01, 1.0, 0.05, 0.01, help=get_help()['binning_tab']['min_threshold'])
             
             # **Add a button to run Association Rule Mining**
             if st.button("🔍 Run Association Rule Mining"):
@@ -442,7 +445,7 @@ def location_granulariser_tab():
 
     preprocess_button = st.button(
         "📂 Start Geocoding", 
-        help=help_info['location_granulariser_tab']['start_geocoding']
+        help=get_help()['location_granulariser_tab']['start_geocoding']
     )
     if preprocess_button:
         perform_geocoding_process(selected_geo_columns, geocoded_data)
@@ -454,11 +457,11 @@ def location_granulariser_tab():
     granularity = st.selectbox(
         "Select Location Granularity",
         options=granularity_options,
-        help=help_info['location_granulariser_tab']['granularity']
+        help=get_help()['location_granulariser_tab']['granularity']
     )
     generate_granular_button = st.button(
         "📈 Generate Granular Location Column",
-        help=help_info['location_granulariser_tab']['generate_granular_location']
+        help=get_help()['location_granulariser_tab']['generate_granular_location']
     )
     if generate_granular_button:
         perform_granular_location_generation(granularity, selected_geo_columns)
@@ -483,7 +486,7 @@ def setup_geocoding_options_ui(geocoded_data: pd.DataFrame) -> list:
     selected_geo_column = st.selectbox(
         "Select a column to geocode",
         options=detected_geo_columns,
-        help=help_info['location_granulariser_tab']['selected_geo_column']
+        help=get_help()['location_granulariser_tab']['selected_geo_column']
     )
 
     logger.debug(f"Selected geographical column for geocoding: {selected_geo_column}")
@@ -617,7 +620,7 @@ def map_section():
         logger.debug("Map data types displayed.")
         
         # Load Map Button
-        load_map_button = st.button("🗺️ Load Map", help=help_info['location_granulariser_tab']['load_map_button'])
+        load_map_button = st.button("🗺️ Load Map", help=get_help()['location_granulariser_tab']['load_map_button'])
         
         if load_map_button:
             # Ensure 'lat' and 'lon' are float
@@ -659,7 +662,7 @@ def unique_identification_analysis_tab():
         selected_columns_uniquetab = granular_columns
     else:
         selected_columns_uniquetab = None
-        st.info(help_info['unique_identification_analysis_tab']['use_bins_location'])
+        st.info(get_help()['unique_identification_analysis_tab']['use_bins_location'])
         logger.info("No columns selected for Unique Identification Analysis.")
 
     if selected_columns_uniquetab:
@@ -682,7 +685,7 @@ def unique_identification_analysis_tab():
 
         if not selected_columns_uniquetab:
             st.warning("⚠️ **No columns selected in Binning or Location Granulariser tabs for analysis.**")
-            st.info(help_info['unique_identification_analysis_tab']['select_columns_unique_analysis'])
+            st.info(get_help()['unique_identification_analysis_tab']['select_columns_unique_analysis'])
             logger.warning("No columns selected for Unique Identification Analysis.")
         else:
             # Verify that selected_columns_uniquetab exist in both ORIGINAL_DATA and GLOBAL_DATA
@@ -703,7 +706,7 @@ def unique_identification_analysis_tab():
             original_for_assessment = st.session_state.ORIGINAL_DATA[existing_columns].astype('category').copy()
             data_for_assessment = st.session_state.GLOBAL_DATA[existing_columns].copy()
 
-            min_comb_size, max_comb_size, submit_button = unique_identification_section_ui(selected_columns_uniquetab)
+            min_comb_size, max_comb_size, n_jobs, submit_button = unique_identification_section_ui(selected_columns_uniquetab)
 
             if submit_button:
                 results = perform_unique_identification_analysis(
@@ -711,7 +714,8 @@ def unique_identification_analysis_tab():
                     data_for_assessment=data_for_assessment,
                     selected_columns_uniquetab=existing_columns,
                     min_comb_size=min_comb_size,
-                    max_comb_size=max_comb_size
+                    max_comb_size=max_comb_size,
+                    n_jobs=n_jobs
                 )
                 if results is not None:
                     update_session_state('Unique_ID_Results', results)
@@ -756,7 +760,7 @@ def unique_identification_analysis_tab():
                         logger.info(f"Entropy plot for Unique ID Analysis saved at {entropy_plot_path}.")
                         
                         # Display entropy plot
-                        st.pyplot(entropy_fig)
+                        st.pyplot(entropy_fig, dpi=PLOT_DPI)
                         logger.debug("Entropy plot for Unique ID Analysis displayed.")
 
                 # Plot density distributions
@@ -785,7 +789,7 @@ def unique_identification_section_ui(selected_columns_uniquetab):
                 max_value=col_count, 
                 value=1, 
                 step=1,
-                help=help_info['unique_identification_analysis_tab']['min_comb_size']
+                help=get_help()['unique_identification_analysis_tab']['min_comb_size']
             )
         with col2:
             max_comb_size = st.number_input(
@@ -794,17 +798,26 @@ def unique_identification_section_ui(selected_columns_uniquetab):
                 max_value=col_count, 
                 value=col_count, 
                 step=1,
-                help=help_info['unique_identification_analysis_tab']['max_comb_size']
+                help=get_help()['unique_identification_analysis_tab']['max_comb_size']
             )
 
         if max_comb_size > 5:
             st.warning("⚠️  **Note:** Combinations larger than 5 may take a long time to compute depending on bin count.")
             logger.warning("Maximum combination size greater than 5 selected.")
 
+        n_jobs = st.number_input(
+            'Max Workers',
+            min_value=1,
+            max_value=os.cpu_count() or 1,
+            value=os.cpu_count() or 1,
+            step=1,
+            help=get_help()['unique_identification_analysis_tab']['n_jobs']
+        )
+
         # Submit button
         submit_button = st.form_submit_button(label='🧮 Perform Unique Identification Analysis')
 
-    return min_comb_size, max_comb_size, submit_button
+    return min_comb_size, max_comb_size, n_jobs, submit_button
 
 # =====================================
 # Data Anonymization Tab Functionality
@@ -1311,7 +1324,7 @@ def synthetic_data_generation_tab():
         options=original_data.columns.tolist(),
         default=original_data.columns.tolist(),
         key="selected_columns",
-        help=help_info['synthetic_data_generation_tab']['selected_columns']
+        help=get_help()['synthetic_data_generation_tab']['selected_columns']
     )
     logger.debug(f"Selected columns for synthetic data generation: {selected_columns}")
 
@@ -1322,7 +1335,7 @@ def synthetic_data_generation_tab():
 
     # Automatically detect data types
     selected_data = original_data[selected_columns]
-    inferred_categorical_columns = selected_data.select_dtypes(include=['object', 'category']).columns.tolist()
+    inferred_categorical_columns = selected_data.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
     inferred_numerical_columns = selected_data.select_dtypes(include=['number']).columns.tolist()
     inferred_datetime_columns = selected_data.select_dtypes(include=['datetime', 'datetime64']).columns.tolist()
 
@@ -1344,7 +1357,7 @@ def synthetic_data_generation_tab():
             options=selected_columns,
             default=inferred_datetime_columns,
             key="datetime_columns",
-            help=help_info['synthetic_data_generation_tab']['select_datetime_columns']
+            help=get_help()['synthetic_data_generation_tab']['select_datetime_columns']
         )
 
         # Multiselect for categorical columns
@@ -1353,7 +1366,7 @@ def synthetic_data_generation_tab():
             options=[col for col in selected_columns if col not in datetime_columns],
             default=inferred_categorical_columns,
             key="categorical_columns",
-            help=help_info['synthetic_data_generation_tab']['select_categorical_columns']
+            help=get_help()['synthetic_data_generation_tab']['select_categorical_columns']
         )
 
         # Multiselect for numerical columns
@@ -1362,7 +1375,7 @@ def synthetic_data_generation_tab():
             options=[col for col in selected_columns if col not in datetime_columns],
             default=inferred_numerical_columns,
             key="numerical_columns",
-            help=help_info['synthetic_data_generation_tab']['select_numerical_columns']
+            help=get_help()['synthetic_data_generation_tab']['select_numerical_columns']
         )
 
         # Ensure all selected columns are assigned to a category
@@ -1389,7 +1402,7 @@ def synthetic_data_generation_tab():
             'Fill with Specific Value'
         ],
         key="missing_value_strategy",
-        help=help_info['synthetic_data_generation_tab']['missing_value_strategy']
+        help=get_help()['synthetic_data_generation_tab']['missing_value_strategy']
     )
     if missing_value_strategy == 'Fill with Specific Value':
         missing_fill_value = st.text_input("Specify the value to fill missing values with:", value="", key="missing_fill_value")
@@ -1414,7 +1427,7 @@ def synthetic_data_generation_tab():
         options=['CTGAN', 'Gaussian Copula'],
         index=0,
         key="method_selection",
-        help=help_info['synthetic_data_generation_tab']['method']
+        help=get_help()['synthetic_data_generation_tab']['method']
     )
     logger.info(f"Selected synthetic data generation method: {method}")
 
@@ -1428,7 +1441,7 @@ def synthetic_data_generation_tab():
             value=300, 
             step=1, 
             key="epochs_input",
-            help=help_info['synthetic_data_generation_tab']['ctgan_epochs']
+            help=get_help()['synthetic_data_generation_tab']['ctgan_epochs']
         )
         batch_size = st.number_input(
             "Batch Size:", 
@@ -1437,7 +1450,7 @@ def synthetic_data_generation_tab():
             value=500, 
             step=1, 
             key="batch_size_input",
-            help=help_info['synthetic_data_generation_tab']['ctgan_batch_size']
+            help=get_help()['synthetic_data_generation_tab']['ctgan_batch_size']
         )
         model_params = {
             'epochs': epochs,
@@ -1457,12 +1470,12 @@ def synthetic_data_generation_tab():
         value=1000,
         step=1,
         key="num_samples_input",
-        help=help_info['synthetic_data_generation_tab']['num_samples']
+        help=get_help()['synthetic_data_generation_tab']['num_samples']
     )
     logger.debug(f"Number of synthetic samples to generate: {num_samples}")
 
     # Button to start synthetic data generation
-    if st.button("🚀 Generate Synthetic Data", key="generate_button", help=help_info['synthetic_data_generation_tab']['generate_synthetic_data']):
+    if st.button("🚀 Generate Synthetic Data", key="generate_button", help=get_help()['synthetic_data_generation_tab']['generate_synthetic_data']):
         try:
             with st.spinner("Training the model and generating synthetic data..."):
                 # Initialize the generator
@@ -1524,7 +1537,7 @@ def synthetic_data_generation_tab():
             "Select a column to compare distributions:",
             options=plot_columns,
             key="column_to_compare",
-            help=help_info['synthetic_data_generation_tab']['compare_distributions']
+            help=get_help()['synthetic_data_generation_tab']['compare_distributions']
         )
         if column_to_compare:
             try:
@@ -1738,21 +1751,21 @@ def data_processing_settings():
             0.0, 1.0, 
             st.session_state.get('date_threshold', 0.0), 
             0.05, 
-            help=help_info['data_processing_settings']['date_detection_threshold']
+            help=get_help()['data_processing_settings']['date_detection_threshold']
         )
         st.session_state.numeric_threshold = st.slider(
             "Numeric Detection Threshold", 
             0.0, 1.0, 
             st.session_state.get('numeric_threshold', 0.0), 
             0.05, 
-            help=help_info['data_processing_settings']['numeric_detection_threshold']
+            help=get_help()['data_processing_settings']['numeric_detection_threshold']
         )
         st.session_state.factor_threshold_ratio = st.slider(
             "Factor Threshold Ratio", 
             0.0, 1.0, 
             st.session_state.get('factor_threshold_ratio', 0.0), 
             0.05, 
-            help=help_info['data_processing_settings']['factor_threshold_ratio']
+            help=get_help()['data_processing_settings']['factor_threshold_ratio']
         )
         st.session_state.factor_threshold_unique = st.number_input(
             "Factor Threshold Unique", 
@@ -1760,22 +1773,22 @@ def data_processing_settings():
             max_value=10000, 
             value=st.session_state.get('factor_threshold_unique', 10), 
             step=10,
-            help=help_info['data_processing_settings']['factor_threshold_unique']
+            help=get_help()['data_processing_settings']['factor_threshold_unique']
         )
         st.session_state.dayfirst = st.checkbox(
             "Day First in Dates", 
             value=st.session_state.get('dayfirst', False),
-            help=help_info['data_processing_settings']['day_first']
+            help=get_help()['data_processing_settings']['day_first']
         )
         st.session_state.convert_factors_to_int = st.checkbox(
             "Convert Factors to Integers", 
             value=st.session_state.get('convert_factors_to_int', False),
-            help=help_info['data_processing_settings']['convert_factors_to_int']
+            help=get_help()['data_processing_settings']['convert_factors_to_int']
         )
         st.session_state.date_format = st.text_input(
             "Date Format (e.g., '%Y-%m-%d')", 
             value=st.session_state.get('date_format', ''),
-            help=help_info['data_processing_settings']['date_format']
+            help=get_help()['data_processing_settings']['date_format']
         )
         logger.debug("Data processing settings updated by user.")
 
@@ -73,7 +73,7 @@ class DataBinner:
                     self.binned_columns['float'].append(col)
                     self.binned_columns[f'{col}_bins'] = bin_labels
                 
-                elif pd.api.types.is_categorical_dtype(Bin_Data[col]) or pd.api.types.is_object_dtype(Bin_Data[col]):
+                elif pd.api.types.is_categorical_dtype(Bin_Data[col]) or pd.api.types.is_object_dtype(Bin_Data[col]) or isinstance(Bin_Data[col].dtype, pd.StringDtype):
                     # Group categorical columns into specified number of bins
                     Bin_Data[col], category_groups = self._bin_categorical_column(Bin_Data[col], bins)
                     self.binned_columns['category_grouped'].append(col)
@@ -90,7 +90,7 @@ class DataBinner:
                     print(f"Failed to bin integer column '{col}': {e}")
                 elif pd.api.types.is_float_dtype(Bin_Data[col]):
                     print(f"Failed to bin float column '{col}': {e}")
-                elif pd.api.types.is_categorical_dtype(Bin_Data[col]) or pd.api.types.is_object_dtype(Bin_Data[col]):
+                elif pd.api.types.is_categorical_dtype(Bin_Data[col]) or pd.api.types.is_object_dtype(Bin_Data[col]) or isinstance(Bin_Data[col].dtype, pd.StringDtype):
                     print(f"Failed to bin category column '{col}': {e}")
                 else:
                     print(f"Failed to bin column '{col}': {e}")
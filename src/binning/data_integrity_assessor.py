@@ -2,15 +2,18 @@
 
 import pandas as pd
 import numpy as np
-from scipy.stats import entropy
 import matplotlib.pyplot as plt
 import os
 from mlxtend.frequent_patterns import apriori, association_rules
 
 class DataIntegrityAssessor:
     def __init__(self, original_df: pd.DataFrame, binned_df: pd.DataFrame):
-        self.original_df = original_df.copy()
-        self.binned_df = binned_df.copy()
+        """
+        Stores references to both DataFrames without copying them; the assessor never
+        modifies them, so callers must not mutate them while the assessor is in use.
+        """
+        self.original_df = original_df
+        self.binned_df = binned_df
         self.integrity_report = None
         self.overall_loss = None
         self.association_report = None
@@ -22,38 +25,45 @@ class DataIntegrityAssessor:
             raise ValueError("Both DataFrames must have the same columns.")
 
         for col in self.original_df.columns:
-            if not pd.api.types.is_object_dtype(self.original_df[col]) and not pd.api.types.is_categorical_dtype(self.original_df[col]):
+            if not pd.api.types.is_object_dtype(self.original_df[col]) and not pd.api.types.is_categorical_dtype(self.original_df[col]) and not isinstance(self.original_df[col].dtype, pd.StringDtype):
                 raise TypeError(f"Column '{col}' is not categorical in the original DataFrame.")
-            if not pd.api.types.is_object_dtype(self.binned_df[col]) and not pd.api.types.is_categorical_dtype(self.binned_df[col]):
+            if not pd.api.types.is_object_dtype(self.binned_df[col]) and not pd.api.types.is_categorical_dtype(self.binned_df[col]) and not isinstance(self.binned_df[col].dtype, pd.StringDtype):
                 raise TypeError(f"Column '{col}' is not categorical in the binned DataFrame.")
 
     @staticmethod
     def calculate_entropy(series: pd.Series) -> float:
-        counts = series.value_counts(normalize=True)
-        return entropy(counts, base=2)
+        codes, _ = pd.factorize(series, sort=False)
+        counts = np.bincount(codes[codes >= 0]).astype(np.float64)
+        total = counts.sum()
+        if total == 0:
+            return 0.0
+        counts /= total
+        # Zero probabilities contribute nothing; skip them instead of evaluating log2(0)
+        log_p = np.zeros_like(counts)
+        np.log2(counts, out=log_p, where=counts > 0)
+        return abs(float(np.dot(counts, log_p)))
 
     def assess_integrity_loss(self):
-        integrity_data = {
-            'Variable': [],
-            'Original Entropy (bits)': [],
-            'Binned Entropy (bits)': [],
-            'Entropy Loss (bits)': [],
-            'Percentage Loss (%)': []
-        }
-
-        for col in self.original_df.columns:
-            original_entropy = self.calculate_entropy(self.original_df[col])
-            binned_entropy = self.calculate_entropy(self.binned_df[col])
-            entropy_loss = original_entropy - binned_entropy
-            percentage_loss = (entropy_loss / original_entropy) * 100 if original_entropy != 0 else 0
-
-            integrity_data['Variable'].append(col)
-            integrity_data['Original Entropy (bits)'].append(round(original_entropy, 6))
-            integrity_data['Binned Entropy (bits)'].append(round(binned_entropy, 6))
-            integrity_data['Entropy Loss (bits)'].append(round(entropy_loss, 6))
-            integrity_data['Percentage Loss (%)'].append(round(percentage_loss, 2))
-
-        self.integrity_report = pd.DataFrame(integrity_data)
+        columns = self.original_df.columns
+        original_entropy = np.empty(len(columns), dtype=np.float64)
+        binned_entropy = np.empty(len(columns), dtype=np.float64)
+
+        for i, col in enumerate(columns):
+            original_entropy[i] = self.calculate_entropy(self.original_df[col])
+            binned_entropy[i] = self.calculate_entropy(self.binned_df[col])
+
+        entropy_loss = original_entropy - binned_entropy
+        # Avoid dividing by zero for constant columns; their loss is reported as 0%
+        safe_original = np.where(original_entropy != 0, original_entropy, 1.0)
+        percentage_loss = np.where(original_entropy != 0, entropy_loss / safe_original * 100, 0.0)
+
+        self.integrity_report = pd.DataFrame({
+            'Variable': list(columns),
+            'Original Entropy (bits)': np.round(original_entropy, 6),
+            'Binned Entropy (bits)': np.round(binned_entropy, 6),
+            'Entropy Loss (bits)': np.round(entropy_loss, 6),
+            'Percentage Loss (%)': np.round(percentage_loss, 2)
+        })
         self.overall_loss = round(self.integrity_report['Percentage Loss (%)'].mean(), 2)
 
     def generate_report(self) -> pd.DataFrame:
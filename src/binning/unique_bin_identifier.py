@@ -1,10 +1,181 @@
 # unique_bin_identifier.py
 
 import pandas as pd
-from itertools import combinations
-from typing import Tuple, List, Dict, Optional
+import numpy as np
+import math
+import os
+import concurrent.futures
+import threading
+from itertools import combinations, islice
+from typing import Tuple, List, Dict, Optional, Callable
 import warnings
 
+try:
+    from numba import njit, prange, get_num_threads, set_num_threads
+    from numba import config as numba_config
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Backends available for counting unique identifications
+SUPPORTED_ENGINES = ['numpy', 'polars', 'duckdb']
+
+# Largest bincount table, relative to the number of keys, used instead of np.unique
+BINCOUNT_MAX_RATIO = 4
+
+# Number of combinations sent to a worker process at a time
+COMBINATION_CHUNK_SIZE = 256
+
+# Number of combinations counted per call of the multi-threaded Numba kernel
+JIT_BATCH_SIZE = 4096
+
+# Memory the hash tables of the Numba kernel may use across all threads (bytes)
+JIT_MEMORY_BUDGET = 512 << 20
+
+# Serialises calls of the parallel Numba kernel; its workqueue threading layer aborts on concurrent use
+_JIT_LOCK = threading.Lock()
+
+# Code matrix shared with worker processes through the pool initializer
+_WORKER_DATA = {}
+
+
+def _count_unique_rows(codes2d: np.ndarray, cols: np.ndarray, bits: np.ndarray) -> int:
+    """
+    Counts the groups of size one formed by a combination of factorized columns.
+
+    Parameters:
+        codes2d (np.ndarray): Integer codes of shape (n_rows, n_cols); missing values are -1.
+        cols (np.ndarray): Indices of the columns in the combination.
+        bits (np.ndarray): Bit width of each column's codes.
+
+    Returns:
+        int: Number of unique identifications.
+    """
+    # Rows with a missing value in any column are not grouped, matching groupby's dropna
+    valid = (codes2d[:, cols] >= 0).all(axis=1)
+
+    if bits[cols].sum() <= 63:
+        # Pack the codes of every column into a single 64-bit key
+        key = np.zeros(int(valid.sum()), dtype=np.int64)
+        shift = 0
+        for col in cols:
+            key |= codes2d[valid, col].astype(np.int64) << shift
+            shift += int(bits[col])
+        if shift <= 24 and (1 << shift) <= BINCOUNT_MAX_RATIO * len(key):
+            # Dense key space: a counting table is cheaper than sorting
+            counts = np.bincount(key)
+        else:
+            _, counts = np.unique(key, return_counts=True)
+    else:
+        # Bit budget exceeded: fall back to sorting the stacked codes row-wise
+        _, counts = np.unique(codes2d[valid][:, cols], axis=0, return_counts=True)
+
+    return int((counts == 1).sum())
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_unique_rows_jit(codes2d, cols):
+        """
+        Numba version of `_count_unique_rows` using an open-addressing hash table
+        keyed on the row's codes (FNV-1a hash, linear probing).
+        """
+        n_rows = codes2d.shape[0]
+
+        # Size the table from the rows without missing values, which are the only ones inserted
+        n_valid = 0
+        for i in range(n_rows):
+            missing = False
+            for c in cols:
+                if codes2d[i, c] < 0:
+                    missing = True
+                    break
+            if not missing:
+                n_valid += 1
+
+        n_buckets = 1
+        while n_buckets < 2 * n_valid:
+            n_buckets <<= 1
+        mask = np.uint64(n_buckets - 1)
+
+        # Each bucket stores the first row seen with its key and the group size
+        bucket_rows = np.full(n_buckets, -1, dtype=np.int32)
+        bucket_counts = np.zeros(n_buckets, dtype=np.int32)
+
+        for i in range(n_rows):
+            h = np.uint64(1469598103934665603)
+            missing = False
+            for c in cols:
+                code = codes2d[i, c]
+                if code < 0:
+                    missing = True
+                    break
+                h = (h ^ np.uint64(code)) * np.uint64(1099511628211)
+            if missing:
+                continue
+
+            slot = np.int64(h & mask)
+            while True:
+                row = bucket_rows[slot]
+                if row == -1:
+                    bucket_rows[slot] = np.int32(i)
+                    bucket_counts[slot] = 1
+                    break
+                same = True
+                for c in cols:
+                    if codes2d[row, c] != codes2d[i, c]:
+                        same = False
+                        break
+                if same:
+                    bucket_counts[slot] += 1
+                    break
+                slot = (slot + 1) & (n_buckets - 1)
+
+        unique_rows = 0
+        for slot in range(n_buckets):
+            if bucket_counts[slot] == 1:
+                unique_rows += 1
+        return unique_rows
+
+    @njit(parallel=True, cache=True)
+    def _count_unique_batch_jit(codes2d, comb_cols, comb_sizes):
+        """
+        Counts the unique identifications of a batch of combinations on parallel threads.
+        Row k of `comb_cols` holds the column indices of combination k, padded past `comb_sizes[k]`.
+        """
+        n_combs = comb_cols.shape[0]
+        counts = np.empty(n_combs, dtype=np.int64)
+        for k in prange(n_combs):
+            counts[k] = _count_unique_rows_jit(codes2d, comb_cols[k, :comb_sizes[k]])
+        return counts
+
+
+def _count_unique_codes(codes2d: np.ndarray, cols: np.ndarray, bits: np.ndarray) -> int:
+    """
+    Counts the unique identifications of a combination, using the Numba kernel when available.
+    """
+    if NUMBA_AVAILABLE:
+        return int(_count_unique_rows_jit(codes2d, cols))
+    return _count_unique_rows(codes2d, cols, bits)
+
+
+def _init_worker(codes2d: np.ndarray, bits: np.ndarray):
+    """
+    Stores the code matrix in the worker process so chunks only carry column indices.
+    """
+    _WORKER_DATA['codes'] = codes2d
+    _WORKER_DATA['bits'] = bits
+
+
+def _count_unique_chunk(chunk: List[Tuple[int, ...]]) -> List[int]:
+    """
+    Counts the unique identifications for a chunk of combinations inside a worker process.
+    """
+    codes2d = _WORKER_DATA['codes']
+    bits = _WORKER_DATA['bits']
+    return [_count_unique_codes(codes2d, np.array(cols, dtype=np.int64), bits) for cols in chunk]
+
+
 class UniqueBinIdentifier:
     """
     A class to identify unique observations in the original DataFrame based on combinations
@@ -19,17 +190,31 @@ class UniqueBinIdentifier:
     def __init__(self, original_df: pd.DataFrame, binned_df: pd.DataFrame):
         """
         Initializes the UniqueBinIdentifier with original and binned DataFrames.
+        The DataFrames are not copied unless their index needs resetting and are never modified.
 
         Parameters:
             original_df (pd.DataFrame): The original DataFrame with full data.
             binned_df (pd.DataFrame): The binned DataFrame with reduced bin counts.
         """
-        self.original_df = original_df.reset_index(drop=True)
-        self.binned_df = binned_df.reset_index(drop=True)
+        self.original_df = self._with_default_index(original_df)
+        self.binned_df = self._with_default_index(binned_df)
         self.results = pd.DataFrame()
 
         self._validate_dataframes()
 
+        # Integer codes of every binned column, computed once and shared by all combinations
+        self._col_index = {col: i for i, col in enumerate(self.binned_df.columns)}
+        self._codes, self._bits = self._factorize_columns()
+
+    @staticmethod
+    def _with_default_index(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns the DataFrame itself if it already has a 0..n-1 index, otherwise a reset copy.
+        """
+        if df.index.equals(pd.RangeIndex(len(df))):
+            return df
+        return df.reset_index(drop=True)
+
     def _validate_dataframes(self):
         """
         Validates that the original and binned DataFrames have the same number of rows.
@@ -42,8 +227,27 @@ class UniqueBinIdentifier:
         min_comb_size: int = 1,
         max_comb_size: Optional[int] = None,
         columns: Optional[List[str]] = None,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        n_jobs: Optional[int] = None,
+        engine: str = 'numpy'
     ) -> pd.DataFrame:
+        """
+        Counts the unique identifications for every combination of the given columns.
+
+        Parameters:
+            min_comb_size (int): Smallest combination size to analyze.
+            max_comb_size (Optional[int]): Largest combination size to analyze. Defaults to all columns.
+            columns (Optional[List[str]]): Columns to combine. Defaults to all binned columns.
+            progress_callback (Optional[callable]): Called with (completed, total) combinations.
+            n_jobs (Optional[int]): Number of Numba threads, or of worker processes when Numba is not
+                installed. Defaults to the number of CPUs; 1 runs the analysis on a single thread.
+                Only used by the 'numpy' engine.
+            engine (str): Counting backend: 'numpy' (integer codes, Numba when available),
+                'polars' or 'duckdb'. The latter two require the optional package to be installed.
+
+        Returns:
+            pd.DataFrame: DataFrame with columns 'Combination' and 'Unique_Identifications'.
+        """
         if columns is None:
             columns = list(self.binned_df.columns)
         else:
@@ -57,67 +261,241 @@ class UniqueBinIdentifier:
         else:
             max_comb_size = min(max_comb_size, len(columns))
 
+        engine = engine.lower()
+        if engine not in SUPPORTED_ENGINES:
+            raise ValueError(f"Unsupported engine '{engine}'. Supported engines are: {SUPPORTED_ENGINES}")
+
         if min_comb_size < 1:
             raise ValueError("min_comb_size must be at least 1.")
 
         if max_comb_size < min_comb_size:
             raise ValueError("max_comb_size must be greater than or equal to min_comb_size.")
 
-        results = []
-
-        total_combinations = sum(
-            [self._nCr(len(columns), r) for r in range(min_comb_size, max_comb_size + 1)]
-        )
+        total_combinations = sum(math.comb(len(columns), r) for r in range(min_comb_size, max_comb_size + 1))
 
         print(f"Total combinations to analyze: {total_combinations}")
 
-        combination_counter = 0
+        if n_jobs is None:
+            n_jobs = os.cpu_count() or 1
+
+        # Results are written by position into arrays sized for every combination
+        combs_arr = np.empty(total_combinations, dtype=object)
+        counts_arr = np.empty(total_combinations, dtype=np.int64)
+        all_combs = (
+            comb
+            for comb_size in range(min_comb_size, max_comb_size + 1)
+            for comb in combinations(columns, comb_size)
+        )
 
-        for comb_size in range(min_comb_size, max_comb_size + 1):
-            for comb in combinations(columns, comb_size):
-                combination_counter += 1
+        if engine == 'numpy' and NUMBA_AVAILABLE:
+            counts_arr[:] = self._count_unique_jit(
+                columns, min_comb_size, max_comb_size, total_combinations, n_jobs, progress_callback
+            )
+            for i, comb in enumerate(all_combs):
+                combs_arr[i] = comb
+        elif engine == 'numpy' and n_jobs > 1 and total_combinations > COMBINATION_CHUNK_SIZE:
+            counts_arr[:] = self._count_unique_parallel(
+                columns, min_comb_size, max_comb_size, total_combinations, n_jobs, progress_callback
+            )
+            for i, comb in enumerate(all_combs):
+                combs_arr[i] = comb
+        else:
+            count_unique = self._get_engine_counter(engine, columns)
+            for combination_counter, comb in enumerate(all_combs, start=1):
                 if progress_callback and combination_counter % 1000 == 0:
                     progress_callback(combination_counter, total_combinations)
-                # Create a temporary DataFrame with the combination of bins
-                temp_df = self.binned_df[list(comb)]
-
-                # Group by the combination and count the number of occurrences
-                group_counts = temp_df.groupby(list(comb)).size()
 
                 # Number of unique identifications is the number of groups with size ==1
-                unique_identifications = (group_counts == 1).sum()
-
-                # Append the result
-                results.append({
-                    'Combination': comb,
-                    'Unique_Identifications': unique_identifications
-                })
-
-        # Create a DataFrame from the results
-        self.results = pd.DataFrame(results)
+                combs_arr[combination_counter - 1] = comb
+                counts_arr[combination_counter - 1] = count_unique(comb)
 
         # Sort the results by 'Unique_Identifications' descending
-        self.results.sort_values(by='Unique_Identifications', ascending=False, inplace=True)
-        self.results.reset_index(drop=True, inplace=True)
+        order = np.argsort(-counts_arr, kind='stable')
+        self.results = pd.DataFrame({
+            'Combination': combs_arr[order],
+            'Unique_Identifications': counts_arr[order]
+        })
 
         print("Unique identification analysis complete.")
 
         return self.results
 
-    @staticmethod
-    def _nCr(n: int, r: int) -> int:
+    def _factorize_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encodes each binned column as integer codes (missing values become -1).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Codes of shape (n_rows, n_cols) and the number of
+            bits needed to store the largest code of each column.
+        """
+        n_rows, n_cols = self.binned_df.shape
+        codes = np.empty((n_rows, n_cols), dtype=np.int32)
+        bits = np.empty(n_cols, dtype=np.int64)
+        for i, col in enumerate(self.binned_df.columns):
+            series = self.binned_df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # Categorical columns already carry integer codes, so no hashing pass is needed
+                col_codes = series.cat.codes.to_numpy()
+                n_uniques = len(series.cat.categories)
+            else:
+                col_codes, uniques = pd.factorize(series, sort=False)
+                n_uniques = len(uniques)
+            codes[:, i] = col_codes
+            bits[i] = max(1, math.ceil(math.log2(n_uniques + 1)))
+        return codes, bits
+
+    def _count_unique_jit(
+        self,
+        columns: List[str],
+        min_comb_size: int,
+        max_comb_size: int,
+        total_combinations: int,
+        n_jobs: int,
+        progress_callback: Optional[callable] = None
+    ) -> np.ndarray:
+        """
+        Counts the unique identifications of all combinations with the multi-threaded Numba kernel,
+        using up to `n_jobs` threads.
+
+        Returns:
+            np.ndarray: Counts in the same order as `itertools.combinations` yields the combinations.
+        """
+        col_indices = [self._col_index[col] for col in columns]
+        index_combs = (
+            comb
+            for comb_size in range(min_comb_size, max_comb_size + 1)
+            for comb in combinations(col_indices, comb_size)
+        )
+
+        counts = np.empty(total_combinations, dtype=np.int64)
+        previous_threads = get_num_threads()
+        # Every thread holds two int32 tables of up to 2 * n_rows buckets (rounded up to a power of two)
+        table_bytes = 8 * (1 << int(2 * len(self._codes) - 1).bit_length())
+        set_num_threads(max(1, min(n_jobs, numba_config.NUMBA_NUM_THREADS, JIT_MEMORY_BUDGET // table_bytes)))
+        try:
+            completed = 0
+            while True:
+                batch = list(islice(index_combs, JIT_BATCH_SIZE))
+                if not batch:
+                    break
+                comb_cols = np.zeros((len(batch), max_comb_size), dtype=np.int64)
+                comb_sizes = np.empty(len(batch), dtype=np.int64)
+                for k, comb in enumerate(batch):
+                    comb_cols[k, :len(comb)] = comb
+                    comb_sizes[k] = len(comb)
+
+                # Concurrent analyses (e.g. separate Streamlit sessions) take turns batch by batch
+                with _JIT_LOCK:
+                    counts[completed:completed + len(batch)] = _count_unique_batch_jit(self._codes, comb_cols, comb_sizes)
+                completed += len(batch)
+                if progress_callback:
+                    progress_callback(completed, total_combinations)
+        finally:
+            set_num_threads(previous_threads)
+
+        return counts
+
+    def _count_unique_parallel(
+        self,
+        columns: List[str],
+        min_comb_size: int,
+        max_comb_size: int,
+        total_combinations: int,
+        n_jobs: int,
+        progress_callback: Optional[callable] = None
+    ) -> List[int]:
+        """
+        Counts the unique identifications of all combinations across a pool of worker processes.
+
+        Returns:
+            List[int]: Counts in the same order as `itertools.combinations` yields the combinations.
+        """
+        col_indices = [self._col_index[col] for col in columns]
+        index_combs = (
+            comb
+            for comb_size in range(min_comb_size, max_comb_size + 1)
+            for comb in combinations(col_indices, comb_size)
+        )
+
+        chunk_results = {}
+        completed = 0
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_worker,
+            initargs=(self._codes, self._bits)
+        ) as executor:
+            futures = {}
+            chunk_id = 0
+            while True:
+                chunk = list(islice(index_combs, COMBINATION_CHUNK_SIZE))
+                if not chunk:
+                    break
+                futures[executor.submit(_count_unique_chunk, chunk)] = chunk_id
+                chunk_id += 1
+
+            for future in concurrent.futures.as_completed(futures):
+                counts = future.result()
+                chunk_results[futures[future]] = counts
+                completed += len(counts)
+                if progress_callback:
+                    progress_callback(completed, total_combinations)
+
+        return [count for chunk_id in sorted(chunk_results) for count in chunk_results[chunk_id]]
+
+    def _get_engine_counter(self, engine: str, columns: List[str]) -> Callable[[Tuple[str, ...]], int]:
+        """
+        Returns a function counting the unique identifications of a combination with the given engine.
+
+        Parameters:
+            engine (str): One of SUPPORTED_ENGINES.
+            columns (List[str]): Columns that combinations will be drawn from.
+
+        Returns:
+            Callable[[Tuple[str, ...]], int]: Counter taking a tuple of column names.
+        """
+        if engine == 'polars':
+            import polars as pl
+
+            pl_df = pl.from_pandas(self.binned_df[columns])
+
+            def count_unique(comb: Tuple[str, ...]) -> int:
+                cols = list(comb)
+                group_sizes = pl_df.select(cols).drop_nulls().group_by(cols).len()
+                return group_sizes.filter(pl.col('len') == 1).height
+
+            return count_unique
+
+        if engine == 'duckdb':
+            import duckdb
+
+            con = duckdb.connect()
+            con.register('bdf', self.binned_df[columns])
+
+            def count_unique(comb: Tuple[str, ...]) -> int:
+                cols = ['"' + col.replace('"', '""') + '"' for col in comb]
+                not_null = ' AND '.join(f'{col} IS NOT NULL' for col in cols)
+                query = (
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM bdf WHERE {not_null} "
+                    f"GROUP BY {', '.join(cols)} HAVING COUNT(*) = 1)"
+                )
+                return con.execute(query).fetchone()[0]
+
+            return count_unique
+
+        return self._count_unique
+
+    def _count_unique(self, comb: Tuple[str, ...]) -> int:
         """
-        Computes the number of combinations (n choose r).
+        Counts the unique identifications for a combination of binned columns.
 
         Parameters:
-            n (int): Total number of items.
-            r (int): Number of items to choose.
+            comb (Tuple[str, ...]): Column names forming the combination.
 
         Returns:
-            int: Number of combinations.
+            int: Number of groups with exactly one observation.
         """
-        from math import comb
-        return comb(n, r)
+        cols = np.array([self._col_index[col] for col in comb], dtype=np.int64)
+        return _count_unique_codes(self._codes, cols, self._bits)
 
     def get_results(self) -> pd.DataFrame:
         """
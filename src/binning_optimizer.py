@@ -209,7 +209,7 @@ def bin_columns(bin_dict: Dict[str, int], original_data: pd.DataFrame) -> Tuple[
                 binned_columns['float'].append(col)
                 binned_columns[f'{col}_bins'] = bin_labels
 
-            elif pd.api.types.is_categorical_dtype(Bin_Data[col]) or pd.api.types.is_object_dtype(Bin_Data[col]):
+            elif pd.api.types.is_categorical_dtype(Bin_Data[col]) or pd.api.types.is_object_dtype(Bin_Data[col]) or isinstance(Bin_Data[col].dtype, pd.StringDtype):
                 binned_series, category_groups = _bin_categorical_column(Bin_Data[col], bins)
                 Bin_Data[col] = binned_series
                 binned_columns['category_grouped'].append(col)
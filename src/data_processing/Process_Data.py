@@ -8,6 +8,59 @@ from typing import Optional, Dict, Any, Tuple
 import sys
 import concurrent.futures
 import re
+import pickle
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Arrow-backed strings are stored in contiguous buffers instead of one Python object per value
+STRING_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else str
+
+# Characters removed from column names
+_CLEAN_RE = re.compile(r'[\\/]')
+
+# Explicit date formats recognised during date detection
+DATE_FORMATS = [
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%d',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y',
+    '%d-%m-%Y %H:%M',
+    '%d-%m-%Y',
+    '%Y/%m/%d %H:%M',
+    '%Y/%m/%d',
+    '%Y-%m-%d %H:%M:%S%z',
+    '%a %b %d %H:%M:%S %z %Y',
+    '%a %b %d %H:%M:%S +0000 %Y'
+]
+
+# Layout of each date format, used to pick a candidate format from a few sample values
+DATE_FORMAT_PATTERNS = {
+    '%d/%m/%Y %H:%M': re.compile(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$'),
+    '%d/%m/%Y': re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'),
+    '%Y-%m-%d %H:%M': re.compile(r'^\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}$'),
+    '%Y-%m-%d': re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$'),
+    '%m/%d/%Y %H:%M': re.compile(r'^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}$'),
+    '%m/%d/%Y': re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'),
+    '%d-%m-%Y %H:%M': re.compile(r'^\d{1,2}-\d{1,2}-\d{4} \d{1,2}:\d{2}$'),
+    '%d-%m-%Y': re.compile(r'^\d{1,2}-\d{1,2}-\d{4}$'),
+    '%Y/%m/%d %H:%M': re.compile(r'^\d{4}/\d{1,2}/\d{1,2} \d{1,2}:\d{2}$'),
+    '%Y/%m/%d': re.compile(r'^\d{4}/\d{1,2}/\d{1,2}$'),
+    '%Y-%m-%d %H:%M:%S%z': re.compile(r'^\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{2}:\d{2}([+-]\d{2}:?\d{2}|Z)$'),
+    '%a %b %d %H:%M:%S %z %Y': re.compile(r'^[A-Za-z]{3} [A-Za-z]{3} \d{1,2} \d{2}:\d{2}:\d{2} [+-]\d{4} \d{4}$'),
+    '%a %b %d %H:%M:%S +0000 %Y': re.compile(r'^[A-Za-z]{3} [A-Za-z]{3} \d{1,2} \d{2}:\d{2}:\d{2} \+0000 \d{4}$')
+}
+
+# Representations accepted as boolean values
+BOOL_VALUES = [0, 1, '0', '1', 'True', 'False', 'true', 'false']
+
+# Number of non-null values inspected when guessing a column's date format
+DATE_GUESS_SAMPLES = 16
 
 class DataProcessor:
     def __init__(
@@ -27,7 +80,9 @@ class DataProcessor:
         log_file: Optional[str] = None,
         convert_factors_to_int: bool = True,
         date_format: Optional[str] = None,  # Keep as None to retain datetime dtype
-        save_type: str = 'csv'
+        save_type: str = 'csv',
+        strict_date_formats: bool = False,
+        detect_sample_size: int = 20000
     ):
         """
         Initialize the DataProcessor with file paths and configuration parameters.
@@ -49,6 +104,9 @@ class DataProcessor:
             convert_factors_to_int (bool): Whether to convert factors to integer codes.
             date_format (Optional[str]): Desired date format for output.
             save_type (str): Type to save the processed data ('csv' or 'pickle').
+            strict_date_formats (bool): Whether to detect dates by trying each explicit format in turn
+                instead of a single parse with the format guessed from sample values.
+            detect_sample_size (int): Maximum number of rows sampled per column for type detection.
         """
         # File paths and configurations
         self.input_filepath = input_filepath
@@ -69,6 +127,8 @@ class DataProcessor:
             'factor_threshold_unique': factor_threshold_unique
         }
         self.dayfirst = dayfirst
+        self.strict_date_formats = strict_date_formats
+        self.detect_sample_size = detect_sample_size
         self.data_types: Dict[str, str] = {}
         self.series_mapping: Dict[str, Dict[int, str]] = {}
 
@@ -94,12 +154,10 @@ class DataProcessor:
         Returns:
             pd.DataFrame: The DataFrame with cleaned column names.
         """
-        original_columns = data.columns.tolist()
-        cleaned_columns = []
-        for col in original_columns:
-            # Remove '/' and '\' from column names
-            cleaned_col = re.sub(r'[\\/]', '', col)
-            cleaned_columns.append(cleaned_col)
+        original_columns = data.columns
+        # Remove '/' and '\' from all column names in one vectorized call
+        cleaned_columns = original_columns.str.replace(_CLEAN_RE, '', regex=True)
+        for col, cleaned_col in zip(original_columns, cleaned_columns):
             if cleaned_col != col:
                 self.logger.debug(f"Renamed column '{col}' to '{cleaned_col}'")
         data.columns = cleaned_columns
@@ -118,54 +176,60 @@ class DataProcessor:
             self.logger.debug(f"Column '{series.name}' is empty. Defaulting to 'string'.")
             return 'string'  # Default to string for empty columns
 
-        num_unique = series.nunique(dropna=True)
+        # Materialize the non-null values once and reuse them in every check below
+        s_nonnull = series.dropna()
+        num_unique = s_nonnull.nunique()
         self.logger.debug(f"Column '{series.name}': Total={total}, Unique={num_unique}")
 
+        # Columns the reader already parsed as datetimes need no further checks
+        if pd.api.types.is_datetime64_any_dtype(s_nonnull):
+            return 'date'
+
         # Attempt to convert to numeric first
         try:
-            s_numeric = pd.to_numeric(series, errors='coerce')
+            if pd.api.types.is_numeric_dtype(s_nonnull):
+                s_numeric = s_nonnull
+            else:
+                s_numeric = pd.to_numeric(s_nonnull, errors='coerce')
             num_not_missing_numeric = s_numeric.notnull().sum()
             percent_numeric = num_not_missing_numeric / total
             self.logger.debug(f"Column '{series.name}': Numeric parse success rate: {percent_numeric:.2f}")
             if percent_numeric > self.thresholds['numeric_threshold']:
-                # Check if all non-NaN values are integers within a tolerance
-                if np.allclose(s_numeric.dropna(), s_numeric.dropna().astype(int), atol=1e-8):
+                # Check if all non-NaN values are whole numbers
+                if self._is_integer_valued(s_numeric):
                     return 'int'
                 else:
                     return 'float'
         except Exception as e:
             self.logger.debug(f"Column '{series.name}': Numeric parsing failed: {e}")
 
-        # Attempt to parse dates with manual checks
-        try:
-            date_formats = [
-                '%d/%m/%Y %H:%M',
-                '%d/%m/%Y',
-                '%Y-%m-%d %H:%M',
-                '%Y-%m-%d',
-                '%m/%d/%Y %H:%M',
-                '%m/%d/%Y',
-                '%d-%m-%Y %H:%M',
-                '%d-%m-%Y',
-                '%Y/%m/%d %H:%M',
-                '%Y/%m/%d',
-                '%Y-%m-%d %H:%M:%S%z',
-                '%a %b %d %H:%M:%S %z %Y',
-                '%a %b %d %H:%M:%S +0000 %Y'
-            ]
-            for fmt in date_formats:
-                s_date = pd.to_datetime(series, errors='coerce', format=fmt, dayfirst=self.dayfirst)
-                num_not_missing_date = s_date.notnull().sum()
-                percent_date = num_not_missing_date / total
-                self.logger.debug(f"Column '{series.name}': Date parse success rate with format '{fmt}': {percent_date:.2f}")
-                if percent_date > self.thresholds['date_threshold']:
-                    return 'date'
-        except Exception as e:
-            self.logger.debug(f"Column '{series.name}': Date parsing failed: {e}")
+        # Attempt to parse dates; mostly-numeric columns have already returned above and
+        # numeric dtypes are never parsed as dates (they would be read as epoch offsets)
+        if not pd.api.types.is_numeric_dtype(s_nonnull):
+            try:
+                if self.strict_date_formats:
+                    for fmt in DATE_FORMATS:
+                        s_date = pd.to_datetime(s_nonnull, errors='coerce', format=fmt, dayfirst=self.dayfirst)
+                        num_not_missing_date = s_date.notnull().sum()
+                        percent_date = num_not_missing_date / total
+                        self.logger.debug(f"Column '{series.name}': Date parse success rate with format '{fmt}': {percent_date:.2f}")
+                        if percent_date > self.thresholds['date_threshold']:
+                            return 'date'
+                else:
+                    # Single pass over the column with the format guessed from a few values
+                    fmt = self._guess_date_format(s_nonnull)
+                    if fmt is not None:
+                        s_date = pd.to_datetime(s_nonnull, errors='coerce', format=fmt, dayfirst=self.dayfirst)
+                        num_not_missing_date = s_date.notnull().sum()
+                        percent_date = num_not_missing_date / total
+                        self.logger.debug(f"Column '{series.name}': Date parse success rate with format '{fmt}': {percent_date:.2f}")
+                        if percent_date > self.thresholds['date_threshold']:
+                            return 'date'
+            except Exception as e:
+                self.logger.debug(f"Column '{series.name}': Date parsing failed: {e}")
 
         # Check for boolean
-        unique_values = set(series.dropna().unique())
-        if unique_values <= {0, 1, '0', '1', 'True', 'False', 'true', 'false'}:
+        if s_nonnull.isin(BOOL_VALUES).all():
             return 'bool'
 
         # Check for categorical (factor) with AND condition
@@ -177,6 +241,37 @@ class DataProcessor:
 
         return 'string'
 
+    def _guess_date_format(self, s_nonnull: pd.Series) -> Optional[str]:
+        """
+        Guess the date format of a Series from its first few non-null values.
+        Returns the format from DATE_FORMATS that parses the most samples, or None if no format matches any.
+        """
+        samples = s_nonnull.iloc[:DATE_GUESS_SAMPLES].astype(str).str.strip()
+        if samples.empty:
+            return None
+
+        # Samples may contain noise such as 'n/a'; date_threshold decides on the full column later
+        candidates = [fmt for fmt, pattern in DATE_FORMAT_PATTERNS.items() if samples.str.match(pattern).any()]
+        if not self.dayfirst:
+            # Prefer month-first layouts when both orders match
+            candidates.sort(key=lambda fmt: not fmt.startswith('%m'))
+        if not candidates:
+            return None
+
+        # Day-first and month-first layouts look alike, so keep the first that parses the most samples
+        parsed = [pd.to_datetime(samples, errors='coerce', format=fmt).notna().sum() for fmt in candidates]
+        return candidates[int(np.argmax(parsed))]
+
+    @staticmethod
+    def _is_integer_valued(s_numeric: pd.Series) -> bool:
+        """
+        Check whether every non-missing value of a numeric Series is a whole number.
+        """
+        vals = s_numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        mask = ~np.isnan(vals)
+        frac, _ = np.modf(vals[mask])
+        return bool(np.all(frac == 0.0))
+
     def convert_series(self, series: pd.Series, dtype: str) -> pd.Series:
         """
         Convert a pandas Series to the specified dtype.
@@ -202,13 +297,16 @@ class DataProcessor:
         elif dtype == 'float':
             return pd.to_numeric(series, errors='coerce')
         elif dtype == 'bool':
-            # Map various representations of booleans to actual booleans
-            return series.map({
-                'True': True, 'False': False, 'true': True, 'false': False,
-                1: True, 0: False
-            }).astype('bool')
+            # Map various representations of booleans to actual booleans; anything else becomes <NA>
+            true_mask = series.isin([True, 1, '1', 'True', 'true']).to_numpy(dtype=bool)
+            false_mask = series.isin([False, 0, '0', 'False', 'false']).to_numpy(dtype=bool)
+            return pd.Series(
+                pd.arrays.BooleanArray(true_mask, ~(true_mask | false_mask)),
+                index=series.index,
+                name=series.name
+            )
         else:
-            return series.astype(str)
+            return series.astype(STRING_DTYPE)
 
     def process_column(self, col: str, data: pd.DataFrame) -> Tuple[str, str, pd.Series]:
         """
@@ -216,23 +314,43 @@ class DataProcessor:
         Returns the column name, detected type, and converted series.
         """
         try:
-            dtype = self.determine_column_type(data[col])
-            converted_series = self.convert_series(data[col], dtype)
+            series = data[col]
+            if len(series) > self.detect_sample_size:
+                # Detect the type on a sample; the conversion below still uses the full column
+                dtype = self.determine_column_type(series.sample(n=self.detect_sample_size, random_state=0))
+                if dtype == 'int' and not self._is_integer_valued(pd.to_numeric(series, errors='coerce')):
+                    # Fractional values may have been left out of the sample
+                    dtype = 'float'
+                elif dtype == 'bool' and not series.dropna().isin(BOOL_VALUES).all():
+                    # Non-boolean values may have been left out of the sample
+                    dtype = self.determine_column_type(series)
+            else:
+                dtype = self.determine_column_type(series)
+            converted_series = self.convert_series(series, dtype)
             self.logger.info(f"Column: {col}, Type Assessed: {dtype}, New Type: {converted_series.dtype}")
             return (col, dtype, converted_series)
         except Exception as e:
             self.logger.warning(f"Failed to process column '{col}': {e}")
             # Default to string if conversion fails
-            converted_series = data[col].astype(str)
+            converted_series = data[col].astype(STRING_DTYPE)
             self.logger.info(f"      New Type: {converted_series.dtype} (defaulted to string)")
             return (col, 'string', converted_series)
 
+    def _process_column_task(self, col: str, data: pd.DataFrame) -> Tuple[str, str, pd.Series, Optional[Dict[int, str]]]:
+        """
+        Process a single column in a worker process.
+        Returns the result of `process_column` together with the column's category mapping, if any.
+        """
+        col, dtype, converted_series = self.process_column(col, data)
+        return (col, dtype, converted_series, self.series_mapping.get(col))
+
     def process_dataframe(
         self,
         filepath: str,
         file_type: str = 'csv',
         use_parallel: bool = True,
-        report_path: str = 'Type_Conversion_Report.csv'
+        report_path: str = 'Type_Conversion_Report.csv',
+        engine: str = 'c'
     ) -> pd.DataFrame:
         """
         Read a CSV or Pickle file, determine column types, convert columns accordingly, and generate a report.
@@ -242,13 +360,24 @@ class DataProcessor:
             file_type (str): Type of the file ('csv' or 'pickle').
             use_parallel (bool): Whether to use parallel processing for columns.
             report_path (str): Path to save the type conversion report.
+            engine (str): Parser engine for CSV files. 'pyarrow' is opt-in and falls back to 'c'
+                if pyarrow is not installed or cannot parse the file.
 
         Returns:
             pd.DataFrame: The processed DataFrame.
         """
         try:
             if file_type == 'csv':
-                data = pd.read_csv(filepath, sep=',')  # Assuming comma-delimited values
+                if engine == 'pyarrow' and not PYARROW_AVAILABLE:
+                    engine = 'c'
+                try:
+                    data = pd.read_csv(filepath, sep=',', engine=engine)  # Assuming comma-delimited values
+                except pd.errors.ParserError as e:
+                    if engine == 'c':
+                        raise
+                    # PyArrow rejects some files the C engine reads, e.g. quoted values spanning lines
+                    self.logger.warning(f"{engine} engine failed to parse {filepath} ({e}); retrying with the C engine.")
+                    data = pd.read_csv(filepath, sep=',', engine='c')
                 self.logger.info(f"Successfully read CSV file: {filepath}")
             elif file_type == 'pkl':
                 data = pd.read_pickle(filepath)
@@ -270,14 +399,18 @@ class DataProcessor:
 
         data_types: Dict[str, str] = {}
 
-        if use_parallel:
+        # Process pools only pay off once there are enough columns to spread across workers
+        if use_parallel and len(data.columns) >= 4:
             self.logger.info("Starting parallel processing of columns.")
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = {executor.submit(self.process_column, col, data): col for col in data.columns}
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {executor.submit(self._process_column_task, col, data[[col]]): col for col in data.columns}
                 for future in concurrent.futures.as_completed(futures):
-                    col, dtype, converted_series = future.result()
+                    col, dtype, converted_series, mapping = future.result()
                     data_types[col] = dtype
                     data[col] = converted_series
+                    # Category mappings are recorded in the worker process, so copy them back
+                    if mapping is not None:
+                        self.series_mapping[col] = mapping
         else:
             self.logger.info("Starting sequential processing of columns.")
             for col in data.columns:
@@ -382,7 +515,7 @@ class DataProcessor:
         elif self.save_type == 'pickle':
             # Save the processed data to the specified output Pickle file
             try:
-                processed_data.to_pickle(self.output_filepath)
+                processed_data.to_pickle(self.output_filepath, protocol=pickle.HIGHEST_PROTOCOL)
                 self.logger.info(f"Processed data saved to {self.output_filepath}")
             except Exception as e:
                 self.logger.error(f"Failed to save processed data: {e}")
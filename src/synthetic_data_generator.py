@@ -71,7 +71,7 @@ class SyntheticDataGenerator:
         else:
             # Automatic data type detection
             self.datetime_columns = self.dataframe.select_dtypes(include=['datetime', 'datetime64']).columns.tolist()
-            self.categorical_columns = self.dataframe.select_dtypes(include=['object', 'category']).columns.tolist()
+            self.categorical_columns = self.dataframe.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
             self.numerical_columns = self.dataframe.select_dtypes(include=['number']).columns.tolist()
 
             # Remove datetime columns from categorical and numerical if detected
@@ -132,28 +132,28 @@ class SyntheticDataGenerator:
             for col in self.numerical_columns:
                 if col in self.dataframe.columns:
                     mean_value = self.dataframe[col].mean()
-                    self.dataframe[col].fillna(mean_value, inplace=True)
+                    self.dataframe[col] = self.dataframe[col].fillna(mean_value)
             for col in self.categorical_columns:
                 if col in self.dataframe.columns:
                     mode_value = self.dataframe[col].mode().iloc[0]
-                    self.dataframe[col].fillna(mode_value, inplace=True)
+                    self.dataframe[col] = self.dataframe[col].fillna(mode_value)
 
         # Fill missing values with median
         elif self.missing_value_strategy == 'median_impute':
             for col in self.numerical_columns:
                 if col in self.dataframe.columns:
                     median_value = self.dataframe[col].median()
-                    self.dataframe[col].fillna(median_value, inplace=True)
+                    self.dataframe[col] = self.dataframe[col].fillna(median_value)
             for col in self.categorical_columns:
                 if col in self.dataframe.columns:
                     mode_value = self.dataframe[col].mode().iloc[0]
-                    self.dataframe[col].fillna(mode_value, inplace=True)
+                    self.dataframe[col] = self.dataframe[col].fillna(mode_value)
 
         # Fill missing values with mode
         elif self.missing_value_strategy == 'mode_impute':
             for col in self.dataframe.columns:
                 mode_value = self.dataframe[col].mode().iloc[0]
-                self.dataframe[col].fillna(mode_value, inplace=True)
+                self.dataframe[col] = self.dataframe[col].fillna(mode_value)
 
         # Fill missing values with a specified value        
         elif self.missing_value_strategy == 'fill':
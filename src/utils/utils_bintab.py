@@ -2,11 +2,29 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import traceback
 from src.binning import DataBinner, DataIntegrityAssessor
 from src.config import REPORTS_DIR
 import os
 
+@st.cache_data(show_spinner=False)
+def _nunique_map(df):
+    """
+    Counts the distinct non-null values of every column once per DataFrame.
+    Categorical columns are counted from their integer codes instead of hashing the values.
+    """
+    counts = {}
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            used = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+            counts[column] = int(np.count_nonzero(used))
+        else:
+            counts[column] = int(series.nunique())
+    return counts
+
 def get_binning_configuration(Data, selected_columns_binning):
     """
     Generates binning configuration sliders for selected columns in two columns.
@@ -17,8 +35,9 @@ def get_binning_configuration(Data, selected_columns_binning):
     # Create two columns
     col1, col2 = st.columns(2)
     
+    nunique = _nunique_map(Data)
     for i, column in enumerate(selected_columns_binning):
-        max_bins = Data[column].nunique()
+        max_bins = nunique[column]
         min_bins = 1 if max_bins >= 2 else 0
         default_bins = min(10, max_bins) if max_bins >= 2 else 1
         
@@ -158,7 +177,6 @@ def perform_association_rule_mining(original_df, binned_df, selected_columns, mi
         st.bar_chart(summary_df[['Original Lift', 'Binned Lift']])
 
         # Save the association report using the new method in the class
-        os.makedirs(REPORTS_DIR, exist_ok=True)
         save_filepath = os.path.join(REPORTS_DIR, 'association_rules_report.csv')
         association_report.to_csv(save_filepath, index=False)
 
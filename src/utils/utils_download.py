@@ -3,6 +3,8 @@
 import streamlit as st
 import pandas as pd
 import traceback
+import io
+import pickle
 
 def download_binned_data(data_full, data, file_type_download='csv'):
     """Handle downloading of the binned data."""
@@ -31,7 +33,10 @@ def handle_download_binned_data(data, file_type_download='csv'):
     st.markdown("### 💾 Download Binned Data")
     try:
         if file_type_download == 'csv':
-            binned_csv = data.to_csv(index=False).encode('utf-8')
+            # Encode straight into a byte buffer rather than building a str and re-encoding it
+            buf = io.BytesIO()
+            data.to_csv(buf, index=False, encoding='utf-8')
+            binned_csv = buf.getvalue()
             st.download_button(
                 label="📥 Download Binned Data as CSV",
                 data=binned_csv,
@@ -39,8 +44,10 @@ def handle_download_binned_data(data, file_type_download='csv'):
                 mime='text/csv',
             )
         elif file_type_download == 'pkl':
-            # Serialize DataFrame to pickle within this function
-            binned_pkl = data.to_pickle(None)  # Using None returns bytes
+            # Serialize DataFrame to pickle in memory
+            buf = io.BytesIO()
+            data.to_pickle(buf, protocol=pickle.HIGHEST_PROTOCOL)
+            binned_pkl = buf.getvalue()
             st.download_button(
                 label="📥 Download Binned Data as Pickle",
                 data=binned_pkl,
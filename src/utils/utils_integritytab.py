@@ -1,9 +1,21 @@
 # src/utils/utils_integritytab.py
 
 import streamlit as st
+import pandas as pd
 import traceback
 from src.binning import DataIntegrityAssessor, UniqueBinIdentifier
 
+# Number of progress bar updates over a full unique identification analysis
+PROGRESS_STEPS = 50
+
+def _compact(df):
+    """
+    Returns df with object columns as categories and integer columns downcast to the smallest integer type.
+    """
+    df = df.astype({col: 'category' for col in df.select_dtypes(include='object').columns})
+    downcast = {col: pd.to_numeric(df[col], downcast='integer') for col in df.select_dtypes(include='integer').columns}
+    return df.assign(**downcast) if downcast else df
+
 def perform_integrity_assessment(OG_Data_BinTab, Data_BinTab, selected_columns_binning):
     """Assess data integrity after binning."""
     original_for_assessment = OG_Data_BinTab[selected_columns_binning].astype('category')
@@ -11,6 +23,16 @@ def perform_integrity_assessment(OG_Data_BinTab, Data_BinTab, selected_columns_b
 
     return handle_integrity_assessment(original_for_assessment, data_for_assessment)
 
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _build_assessor(original_df, binned_df):
+    """
+    Builds an assessor with its integrity loss already computed. Results are shared across
+    reruns and keyed on the contents of both DataFrames; the assessor is only read afterwards.
+    """
+    assessor = DataIntegrityAssessor(original_df=original_df, binned_df=binned_df)
+    assessor.assess_integrity_loss()
+    return assessor
+
 def handle_integrity_assessment(original_df, binned_df):
     """
     Handles the integrity assessment process, including generating reports and plotting entropy.
@@ -20,8 +42,7 @@ def handle_integrity_assessment(original_df, binned_df):
         entropy_fig (matplotlib.figure.Figure): Entropy plot figure.
     """
     try:
-        assessor = DataIntegrityAssessor(original_df=original_df, binned_df=binned_df)
-        assessor.assess_integrity_loss()
+        assessor = _build_assessor(_compact(original_df), _compact(binned_df))
         report = assessor.generate_report()
         overall_loss = assessor.get_overall_loss()
         entropy_fig = assessor.plot_entropy(figsize=(15, 4))
@@ -31,15 +52,29 @@ def handle_integrity_assessment(original_df, binned_df):
         st.error(traceback.format_exc())
         return None, None, None
 
-def perform_unique_identification_analysis(original_for_assessment, data_for_assessment, selected_columns_uniquetab, min_comb_size, max_comb_size):
-    """Handle the Unique Identification Analysis process."""
+def perform_unique_identification_analysis(original_for_assessment, data_for_assessment, selected_columns_uniquetab, min_comb_size, max_comb_size, n_jobs=None):
+    """Handle the Unique Identification Analysis process, reporting progress in a progress bar."""
     try:
-        assessor = UniqueBinIdentifier(original_df=original_for_assessment, binned_df=data_for_assessment)
+        progress_bar = st.progress(0.0, text="Analyzing combinations...")
+        last_step = 0
+
+        def update_progress(completed, total):
+            # Only redraw when progress crosses the next of PROGRESS_STEPS steps
+            nonlocal last_step
+            step = completed * PROGRESS_STEPS // total if total else PROGRESS_STEPS
+            if step != last_step:
+                last_step = step
+                progress_bar.progress(step / PROGRESS_STEPS, text=f"Analyzed {completed}/{total} combinations")
+
+        assessor = UniqueBinIdentifier(original_df=_compact(original_for_assessment), binned_df=_compact(data_for_assessment))
         results = assessor.find_unique_identifications(
             min_comb_size=min_comb_size, 
             max_comb_size=max_comb_size, 
-            columns=selected_columns_uniquetab
+            columns=selected_columns_uniquetab,
+            progress_callback=update_progress,
+            n_jobs=n_jobs
         )
+        progress_bar.empty()
         return results
     except Exception as e:
         st.error(f"Error during unique identification analysis: {e}")
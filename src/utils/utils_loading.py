@@ -2,30 +2,70 @@
 
 import streamlit as st
 import pandas as pd
-import tempfile
+import io
 import os
+import hashlib
+import mmap
 
-def load_data(file_type, uploaded_file):
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Block size for the multi-threaded Arrow CSV reader
+ARROW_BLOCK_SIZE = 64 << 20
+
+# Pickles larger than this are read through a memory map
+MMAP_PICKLE_THRESHOLD = 64 << 20
+
+def _arrow_types_mapper(arrow_type):
+    """
+    Maps Arrow string columns to pandas' Arrow-backed string dtype; other types use the default conversion.
+    """
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype('pyarrow')
+    return None
+
+def _read_csv_arrow(source):
+    """
+    Reads a CSV file path or buffer with the multi-threaded PyArrow reader.
+    """
+    table = pv.read_csv(
+        source,
+        read_options=pv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE),
+        # Quoted values may span several lines, as the pandas C engine allows
+        parse_options=pv.ParseOptions(newlines_in_values=True),
+    )
+    return table.to_pandas(types_mapper=_arrow_types_mapper)
+
+def _hash_uploaded_file(uploaded_file):
+    """
+    Hashes an uploaded file by its contents so identical uploads share a cache entry.
+    """
+    return hashlib.md5(uploaded_file.getvalue(), usedforsecurity=False).digest()
+
+@st.cache_data(show_spinner=False, hash_funcs={"streamlit.runtime.uploaded_file_manager.UploadedFile": _hash_uploaded_file})
+def load_data(file_type, uploaded_file, use_arrow=False):
     """
     Loads the uploaded file into a Pandas DataFrame without any processing.
+    CSV files are parsed with PyArrow when use_arrow is set and PyArrow is installed.
     """
     if uploaded_file is None:
         return None, "No file uploaded!"
 
     try:
-        file_extension = {"pkl": "pkl", "csv": "csv"}.get(file_type, "csv")
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_extension}") as tmp_file:
-            tmp_file.write(uploaded_file.getbuffer())
-            temp_file_path = tmp_file.name
+        # Parse straight from the uploaded bytes instead of a temporary file
+        buf = io.BytesIO(uploaded_file.getbuffer())
 
         if file_type == "pkl":
-            Data = pd.read_pickle(temp_file_path)
+            Data = pd.read_pickle(buf)
         elif file_type == "csv":
-            Data = pd.read_csv(temp_file_path)
+            Data = _read_csv_arrow(buf) if use_arrow and PYARROW_AVAILABLE else pd.read_csv(buf)
         else:
             return None, "Unsupported file type!"
 
-        os.remove(temp_file_path)
         return Data, None
     except Exception as e:
         return None, f"Error loading data: {e}"
@@ -36,25 +76,39 @@ def align_dataframes(original_df, binned_df):
     """
     try:
         missing_in_binned = original_df.columns.difference(binned_df.columns)
-        for column in missing_in_binned:
-            binned_df[column] = original_df[column]
-        binned_df = binned_df[original_df.columns]
+        # Add all missing columns in one concat instead of one insert per column
+        binned_df = pd.concat([binned_df, original_df[missing_in_binned]], axis=1)[original_df.columns]
         return original_df, binned_df
     except Exception as e:
         st.error(f"Error aligning dataframes: {e}")
         st.stop()
 
-def load_dataframe(file_path, file_type):
+@st.cache_data(show_spinner=False)
+def _read_dataframe(file_path, file_type, use_arrow, mtime):
+    """
+    Reads a DataFrame from disk. The file's modification time is part of the cache key,
+    so a rewritten file is read again.
+    """
+    if file_type == 'csv':
+        if use_arrow and PYARROW_AVAILABLE:
+            return _read_csv_arrow(file_path)
+        return pd.read_csv(file_path)
+    elif file_type == 'pkl':
+        if os.path.getsize(file_path) > MMAP_PICKLE_THRESHOLD:
+            # Unpickle from the page cache instead of copying through a read buffer
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pd.read_pickle(mm)
+        return pd.read_pickle(file_path)
+    else:
+        raise ValueError("Unsupported file type for loading.")
+
+def load_dataframe(file_path, file_type, use_arrow=False):
     """
     Loads a DataFrame from the specified file path and type.
+    CSV files are parsed with PyArrow when use_arrow is set and PyArrow is installed.
     """
     try:
-        if file_type == 'csv':
-            return pd.read_csv(file_path)
-        elif file_type == 'pkl':
-            return pd.read_pickle(file_path)
-        else:
-            raise ValueError("Unsupported file type for loading.")
+        return _read_dataframe(file_path, file_type, use_arrow, os.path.getmtime(file_path))
     except Exception as e:
         st.error(f"Error loading DataFrame: {e}")
         st.stop()
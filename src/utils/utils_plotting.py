@@ -3,6 +3,7 @@
 import streamlit as st
 import matplotlib.pyplot as plt
 from typing import List, Optional, Tuple
+from .utils_general import PLOT_DPI
 import traceback
 import seaborn as sns
 import pandas as pd
@@ -49,21 +50,14 @@ def plot_density_plots_streamlit(original_df, binned_df, selected_columns):
         tab1, tab2 = st.tabs(["Original Data", "Binned Data"])
         
         with tab1:
-            st.pyplot(fig_orig)
+            st.pyplot(fig_orig, dpi=PLOT_DPI)
         
         with tab2:
-            st.pyplot(fig_binned)
+            st.pyplot(fig_binned, dpi=PLOT_DPI)
     
     except Exception as e:
         st.error(f"Failed to generate density plots: {e}")
 
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-import math
-import os
-from typing import List, Tuple, Optional
-
 def plot_density_barplots(
     dataframe: pd.DataFrame,
     columns: List[str],
@@ -208,7 +202,7 @@ def plot_density_barplots(
     for idx in range(total_plots, len(axes)):
         fig.delaxes(axes[idx])
 
-    plt.tight_layout()  # Adjust subplots to fit into the figure area
+    fig.tight_layout()  # Adjust subplots to fit into the figure area
 
     # Save or show the plot
     if save_path:
@@ -217,7 +211,7 @@ def plot_density_barplots(
         if save_dir:
             os.makedirs(save_dir, exist_ok=True)
         try:
-            plt.savefig(save_path, dpi=300)
+            fig.savefig(save_path, dpi=300)
             print(f"Density bar plots saved to {save_path}")
         except Exception as e:
             print(f"Failed to save plot to '{save_path}': {e}")
@@ -297,24 +291,6 @@ def plot_date_distributions(original_df, synthetic_df, column):
     ax.legend()
     st.pyplot(fig)
 
-def compare_correlations(original_df, synthetic_df, categorical_columns):
-    """Compare correlation matrices of original and synthetic data."""
-    # Compute correlation matrices
-    original_corr = original_df.select_dtypes(include=['number']).corr()
-    synthetic_corr = synthetic_df.select_dtypes(include=['number']).corr()
-
-    # Plot original correlations
-    fig, ax = plt.subplots(1, 2, figsize=(16, 6))
-    sns.heatmap(original_corr, annot=True, fmt=".2f", cmap='coolwarm', ax=ax[0])
-    ax[0].set_title('Original Data Correlation Matrix')
-
-    # Plot synthetic correlations
-    sns.heatmap(synthetic_corr, annot=True, fmt=".2f", cmap='coolwarm', ax=ax[1])
-    ax[1].set_title('Synthetic Data Correlation Matrix')
-
-    st.pyplot(fig)
-
-
 def convert_categories_to_integers(df, categorical_columns):
     """Convert categorical columns to integer codes."""
     df_copy = df.copy()
@@ -379,12 +355,6 @@ def compare_correlations(original_df, synthetic_df, categorical_columns):
         st.error(traceback.format_exc())
 
 
-# src/utils/utils_plotting.py
-
-import matplotlib.pyplot as plt
-from typing import List
-import pandas as pd
-
 def plot_fitness_history(fitness_history: List[float], title: str) -> plt.Figure:
     """Plots the fitness over iterations."""
     fig, ax = plt.subplots(figsize=(10, 6))